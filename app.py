@@ -5,16 +5,25 @@ registration links, and participants register themselves publicly.
 Features: Admin auth, token-based public registration, event management.
 
 Deployment: Compatible with Render, Heroku, and other WSGI-based platforms.
-Start with: gunicorn app:app
+Start with: gunicorn app:app -k gthread --workers 2 --threads 4 --preload
+(gthread workers suit this I/O-bound SQLite workload - sync workers block the
+whole worker on every lock wait and fsync; --preload runs startup init once.)
 """
 
 import sqlite3
 from flask import Flask, render_template, request, redirect, url_for, flash, session
-from functools import wraps
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 from datetime import datetime
+import atexit
+import base64
+import fcntl
+import hashlib
 import os
 import re
 import secrets
+import threading
+import time
 
 app = Flask(__name__)
 
@@ -44,23 +53,102 @@ print(f"📁 Database: {DATABASE}")
 # ============================================
 
 def get_db_connection():
-    """Establish a connection to the SQLite database."""
-    conn = sqlite3.connect(DATABASE)
+    """Establish a connection to the SQLite database with tuned PRAGMAs."""
+    conn = sqlite3.connect(DATABASE, timeout=5.0, isolation_level=None,
+                           check_same_thread=False, cached_statements=128)
     conn.row_factory = sqlite3.Row
+
+    # Performance PRAGMAs: WAL lets readers run concurrently with the single
+    # admin writer, and synchronous=NORMAL skips the per-commit journal fsync
+    # (safe under WAL - a crash can only lose the last transaction, never
+    # corrupt the database)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA cache_size=-65536')
+    conn.execute('PRAGMA foreign_keys=ON')
+    conn.execute('PRAGMA busy_timeout=5000')
+    return conn
+
+
+# Connection pool: opening a fresh SQLite handle per query re-opens the .db,
+# .db-wal and .db-shm files every time - pure syscall overhead. Under WAL,
+# reads never block the writer, so we keep one long-lived reader connection
+# per worker thread plus a single shared writer guarded by a lock.
+_writer_conn = None
+_writer_lock = threading.Lock()
+_readers = threading.local()
+_reader_conns = []  # all reader connections, for shutdown cleanup
+
+
+def get_reader():
+    """Return this thread's long-lived read-only-use connection."""
+    conn = getattr(_readers, 'conn', None)
+    if conn is None:
+        conn = get_db_connection()
+        _readers.conn = conn
+        _reader_conns.append(conn)
     return conn
 
 
+def get_writer():
+    """Return the shared writer connection (callers must hold _writer_lock)."""
+    global _writer_conn
+    if _writer_conn is None:
+        _writer_conn = get_db_connection()
+    return _writer_conn
+
+
+@contextmanager
+def write_tx():
+    """
+    Run a write transaction on the shared writer connection.
+
+    BEGIN IMMEDIATE takes the write lock upfront instead of lazily at the
+    first modifying statement, so concurrent writers queue cleanly rather
+    than upgrade-racing into SQLITE_BUSY. Commits on success, rolls back if
+    the body raises.
+    """
+    with _writer_lock:
+        conn = get_writer()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+
+
+@atexit.register
+def _close_connections():
+    """Close pooled connections on interpreter shutdown."""
+    if _writer_conn is not None:
+        _writer_conn.close()
+    for conn in _reader_conns:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
 def init_db():
     """Initialize the database with EVENTS and PARTICIPANTS tables."""
     
-    # IMPORTANT: Run migration FIRST to add missing columns to existing tables
+    # IMPORTANT: Run migrations FIRST to add missing columns to existing tables
     # This must happen before CREATE TABLE IF NOT EXISTS because that statement
     # won't modify existing tables that are missing columns
     migrate_add_registration_token()
+    migrate_add_participant_count()
     
     conn = get_db_connection()
     cursor = conn.cursor()
-    
+
+    # WAL mode is persistent - setting it once here sticks for every future
+    # connection, so per-connection PRAGMAs only need to confirm it
+    cursor.execute('PRAGMA journal_mode=WAL')
+
     # Create EVENTS table with registration token (only if table doesn't exist)
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS EVENTS (
@@ -69,6 +157,7 @@ def init_db():
             description TEXT,
             date TEXT,
             registration_token TEXT,
+            participant_count INTEGER NOT NULL DEFAULT 0,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     ''')
@@ -86,10 +175,87 @@ def init_db():
             UNIQUE(event_id, email)
         )
     ''')
-    
+
+    # Full-text index over participant names/emails: FTS5 turns the search
+    # page's unindexable LOWER() LIKE scan into an inverted-index lookup.
+    # Track whether the virtual table already existed so we only rebuild it
+    # from PARTICIPANTS when it's first created on an existing database.
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='participants_fts'")
+    fts_existed = cursor.fetchone() is not None
+
+    cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS participants_fts USING fts5(
+            name, email,
+            content='PARTICIPANTS', content_rowid='id',
+            tokenize='unicode61'
+        )
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_part_fts_ins AFTER INSERT ON PARTICIPANTS
+        BEGIN
+            INSERT INTO participants_fts(rowid, name, email)
+            VALUES (NEW.id, NEW.name, NEW.email);
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_part_fts_del AFTER DELETE ON PARTICIPANTS
+        BEGIN
+            INSERT INTO participants_fts(participants_fts, rowid, name, email)
+            VALUES ('delete', OLD.id, OLD.name, OLD.email);
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_part_fts_upd AFTER UPDATE ON PARTICIPANTS
+        BEGIN
+            INSERT INTO participants_fts(participants_fts, rowid, name, email)
+            VALUES ('delete', OLD.id, OLD.name, OLD.email);
+            INSERT INTO participants_fts(rowid, name, email)
+            VALUES (NEW.id, NEW.name, NEW.email);
+        END
+    ''')
+
+    if not fts_existed:
+        # Index any participants registered before the FTS table existed
+        cursor.execute("INSERT INTO participants_fts(participants_fts) VALUES ('rebuild')")
+
+    # Indexes for the hot lookup paths: participant listing/counting filters
+    # by event_id, and every public registration page load resolves a token.
+    # The token index is partial so NULL tokens on legacy rows don't collide.
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_participants_event ON PARTICIPANTS(event_id)')
+    cursor.execute('''
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_events_token
+        ON EVENTS(registration_token) WHERE registration_token IS NOT NULL
+    ''')
+
+    # Triggers keep EVENTS.participant_count in sync so reading a count is a
+    # primary-key fetch instead of a COUNT(*) over PARTICIPANTS
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_part_inc AFTER INSERT ON PARTICIPANTS
+        BEGIN
+            UPDATE EVENTS SET participant_count = participant_count + 1
+            WHERE id = NEW.event_id;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_part_dec AFTER DELETE ON PARTICIPANTS
+        BEGIN
+            UPDATE EVENTS SET participant_count = participant_count - 1
+            WHERE id = OLD.event_id;
+        END
+    ''')
+
     conn.commit()
+
+    # Post-migration sanity check: the hot paths read registration_token
+    # directly (no defensive fallback), so fail fast at startup if the
+    # column is somehow still missing
+    cursor.execute('PRAGMA table_info(EVENTS)')
+    columns = [column[1] for column in cursor.fetchall()]
+    assert 'registration_token' in columns, \
+        'EVENTS.registration_token missing after migration'
+
     conn.close()
-    
+
     print("✓ Database initialized successfully.")
 
 
@@ -138,16 +304,31 @@ def migrate_add_registration_token():
         # This handles old events created before the token feature
         cursor.execute('SELECT id FROM EVENTS WHERE registration_token IS NULL OR registration_token = ""')
         events_without_tokens = cursor.fetchall()
-        
-        for event in events_without_tokens:
-            new_token = generate_registration_token()
-            cursor.execute('UPDATE EVENTS SET registration_token = ? WHERE id = ?', (new_token, event['id']))
-            print(f"⚙️ Generated token for event ID {event['id']}")
-        
+
         if events_without_tokens:
+            # One explicit transaction for the whole backfill: with autocommit
+            # connections each UPDATE would otherwise fsync individually,
+            # turning a large migration into N disk syncs instead of one
+            # executemany binds once and iterates the parameter list in C,
+            # skipping the per-row Python execute() overhead; tokens come
+            # from one batched entropy draw instead of a syscall per row
+            tokens = _token_batch(len(events_without_tokens))
+            updates = [(new_token, event['id'])
+                       for new_token, event in zip(tokens, events_without_tokens)]
+            conn.execute('BEGIN')
+            cursor.executemany('UPDATE EVENTS SET registration_token = ? WHERE id = ?',
+                               updates)
             conn.commit()
             print(f"✅ Generated tokens for {len(events_without_tokens)} existing event(s).")
-        
+
+        # The ALTER TABLE above can't add a UNIQUE constraint, so make token
+        # lookups an index probe here instead of a full table scan
+        cursor.execute('''
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_events_token
+            ON EVENTS(registration_token) WHERE registration_token IS NOT NULL
+        ''')
+        conn.commit()
+
     except sqlite3.Error as e:
         print(f"⚠️ Migration error (non-fatal): {e}")
         # Don't crash - the app can still work for new events
@@ -156,38 +337,131 @@ def migrate_add_registration_token():
             conn.close()
 
 
+def migrate_add_participant_count():
+    """
+    Database Migration: Add participant_count column if it doesn't exist.
+
+    The counter is maintained by the INSERT/DELETE triggers created in
+    init_db(), so reads become an O(1) primary-key fetch on EVENTS instead
+    of counting PARTICIPANTS rows. This migration adds the column to old
+    databases and backfills it from the current participant rows.
+    """
+    conn = None
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        # Nothing to migrate if the EVENTS table doesn't exist yet
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='EVENTS'")
+        if not cursor.fetchone():
+            conn.close()
+            return
+
+        cursor.execute("PRAGMA table_info(EVENTS)")
+        columns = [column[1] for column in cursor.fetchall()]
+
+        if 'participant_count' not in columns:
+            print("⚙️ Migrating database: Adding participant_count column...")
+            conn.execute('BEGIN')
+            cursor.execute('ALTER TABLE EVENTS ADD COLUMN participant_count INTEGER NOT NULL DEFAULT 0')
+
+            # Backfill from existing registrations (if that table exists)
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='PARTICIPANTS'")
+            if cursor.fetchone():
+                cursor.execute('''
+                    UPDATE EVENTS SET participant_count = (
+                        SELECT COUNT(*) FROM PARTICIPANTS
+                        WHERE PARTICIPANTS.event_id = EVENTS.id
+                    )
+                ''')
+            conn.commit()
+            print("✅ Column added and backfilled successfully.")
+
+    except sqlite3.Error as e:
+        print(f"⚠️ Migration error (non-fatal): {e}")
+        # Don't crash - get_participant_count degrades to reporting 0
+    finally:
+        if conn:
+            conn.close()
+
+
+def init_db_once():
+    """
+    Run init_db() once per deployment startup, not once per worker.
+
+    Under Gunicorn's pre-fork model every worker imports this module, so an
+    unguarded init_db() re-runs the migrations and PRAGMA/table_info scans in
+    each worker - and the DDL attempts can race each other. An exclusive
+    flock serializes the workers; a sentinel file whose mtime is refreshed
+    after a successful init lets the workers that lost the race skip the
+    work entirely. A sentinel older than the freshness window (i.e. from a
+    previous deploy) triggers a normal re-init, keeping migrations active
+    across restarts.
+    """
+    lock_path = DATABASE + '.initlock'
+    sentinel_path = DATABASE + '.initdone'
+    freshness_window = 30  # seconds; workers of one startup fork within this
+
+    with open(lock_path, 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            try:
+                sentinel_age = time.time() - os.path.getmtime(sentinel_path)
+            except OSError:
+                sentinel_age = None  # no sentinel yet - first ever startup
+
+            if sentinel_age is not None and sentinel_age < freshness_window:
+                print("✓ Database already initialized by another worker.")
+                return
+
+            init_db()
+            with open(sentinel_path, 'w'):
+                pass
+            os.utime(sentinel_path)
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
 def generate_registration_token():
     """Generate a secure unique registration token for events."""
     return secrets.token_urlsafe(16)
 
 
-def get_event_token_safely(event):
+def _token_batch(n):
     """
-    Safely retrieve registration_token from an event row.
-    This defensive function prevents IndexError when:
-    - The column doesn't exist in an old database
-    - The token value is NULL or empty
-    
-    Args:
-        event: SQLite Row object or dict representing an event
-    
-    Returns:
-        str: The registration token, or None if not available
+    Generate n registration tokens from a single entropy draw.
+
+    Each secrets.token_urlsafe(16) call costs its own getrandom() syscall;
+    for the migration backfill over many events one os.urandom read supplies
+    all of them. Output format matches token_urlsafe: 16 random bytes,
+    urlsafe-base64, padding stripped.
     """
-    try:
-        # Try to access the token - this may raise IndexError if column doesn't exist
-        token = event['registration_token']
-        # Return None if token is empty string or None
-        return token if token else None
-    except (IndexError, KeyError):
-        # Column doesn't exist or key not found - return None gracefully
-        return None
+    raw = os.urandom(16 * n)
+    return [base64.urlsafe_b64encode(raw[i * 16:(i + 1) * 16]).rstrip(b'=').decode()
+            for i in range(n)]
 
 
 # ============================================
 # AUTHENTICATION HELPERS
 # ============================================
 
+# Werkzeug rebuilds external URLs (scheme + host interpolation) on every
+# url_for(..., _external=True) call. Tokens are immutable once generated, so
+# the URL is cached per (host, token) - keyed on host to stay correct if the
+# app is served from several domains. Cleared on event create/delete.
+_url_cache = {}
+
+
+def registration_url_for(token):
+    """Build (or fetch from cache) the external registration URL for a token."""
+    cache_key = (request.host, token)
+    reg_url = _url_cache.get(cache_key)
+    if reg_url is None:
+        reg_url = url_for('public_register', token=token, _external=True)
+        _url_cache[cache_key] = reg_url
+    return reg_url
+
+
 def login_required(f):
     """Decorator to protect routes that require admin login."""
     @wraps(f)
@@ -199,63 +473,86 @@ def login_required(f):
     return decorated_function
 
 
+# Compiled once at import; \Z instead of $ so a trailing newline can't sneak
+# past the anchor
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+
+
 def is_valid_email(email):
     """Validate email format using regex."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
+
+
+def _fts_prefix_query(search_query):
+    """
+    Turn raw user input into a safe FTS5 prefix-match expression.
+
+    Each whitespace-separated term is double-quoted (neutralizing FTS5
+    operators like NEAR/OR/-) and given a trailing * so partial names and
+    email fragments still match, e.g. 'jo smi' -> '"jo"* "smi"*'.
+    """
+    return ' '.join(
+        '"{}"*'.format(term.replace('"', '""'))
+        for term in search_query.split()
+    )
+
+
+# Hot-path SQL as module constants: sqlite3 keeps a per-connection LRU of
+# compiled statements (sized by cached_statements= above) keyed on the SQL
+# text, so reusing the exact same string on the long-lived pooled connections
+# means these queries are parsed and planned once, then replayed
+SQL_GET_EVENT_BY_ID = 'SELECT * FROM EVENTS WHERE id = ?'
+SQL_GET_EVENT_BY_TOKEN = 'SELECT * FROM EVENTS WHERE registration_token = ?'
+SQL_GET_ALL_EVENTS = 'SELECT * FROM EVENTS ORDER BY created_at DESC'
+SQL_GET_PARTICIPANT_COUNT = 'SELECT participant_count FROM EVENTS WHERE id = ?'
+SQL_PARTICIPANT_EXISTS = 'SELECT id FROM PARTICIPANTS WHERE email = ? AND event_id = ?'
+SQL_INSERT_PARTICIPANT = '''
+    INSERT OR ABORT INTO PARTICIPANTS (event_id, name, email, college)
+    VALUES (?, ?, ?, ?)
+'''
 
 
 def participant_exists_in_event(email, event_id):
     """Check if participant email already exists for a specific event."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        'SELECT id FROM PARTICIPANTS WHERE email = ? AND event_id = ?',
-        (email, event_id)
-    )
-    result = cursor.fetchone()
-    conn.close()
+    result = get_reader().execute(
+        SQL_PARTICIPANT_EXISTS, (email, event_id)
+    ).fetchone()
     return result is not None
 
 
 def get_event_by_id(event_id):
     """Fetch a single event by its ID."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM EVENTS WHERE id = ?', (event_id,))
-    event = cursor.fetchone()
-    conn.close()
-    return event
+    return get_reader().execute(SQL_GET_EVENT_BY_ID, (event_id,)).fetchone()
+
+
+# Events change rarely (admin creates/deletes them), but every GET on
+# /register/<token> - including bots and refreshes - hits this lookup. The
+# extra TTL-bucket argument makes cached entries expire naturally after ~60s;
+# create/delete also clear the cache explicitly for immediate consistency.
+_EVENT_CACHE_TTL = 60  # seconds
+
+
+@lru_cache(maxsize=512)
+def _get_event_row_cached(token, _ttl_bucket):
+    """Cached token lookup; returns a plain dict (sqlite3.Row can't be cached)."""
+    row = get_reader().execute(SQL_GET_EVENT_BY_TOKEN, (token,)).fetchone()
+    return dict(row) if row else None
 
 
 def get_event_by_token(token):
-    """Fetch an event by its registration token."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM EVENTS WHERE registration_token = ?', (token,))
-    event = cursor.fetchone()
-    conn.close()
-    return event
+    """Fetch an event by its registration token (cached for up to 60s)."""
+    return _get_event_row_cached(token, int(time.monotonic() // _EVENT_CACHE_TTL))
 
 
 def get_all_events():
     """Fetch all events ordered by creation date."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM EVENTS ORDER BY created_at DESC')
-    events = cursor.fetchall()
-    conn.close()
-    return events
+    return get_reader().execute(SQL_GET_ALL_EVENTS).fetchall()
 
 
 def get_participant_count(event_id):
-    """Get the number of participants for an event."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('SELECT COUNT(*) as count FROM PARTICIPANTS WHERE event_id = ?', (event_id,))
-    result = cursor.fetchone()
-    conn.close()
-    return result['count'] if result else 0
+    """Get the number of participants for an event (trigger-maintained counter)."""
+    result = get_reader().execute(SQL_GET_PARTICIPANT_COUNT, (event_id,)).fetchone()
+    return result['participant_count'] if result else 0
 
 
 # ============================================
@@ -305,32 +602,71 @@ def logout():
 # DASHBOARD ROUTES (ADMIN ONLY)
 # ============================================
 
+def _dashboard_state_key():
+    """
+    Fingerprint of everything the dashboard renders: event count, newest
+    event timestamp, total registrations, highest participant id ever
+    issued, and the serving host (external URLs embed it). The count alone
+    can't distinguish offsetting changes (delete one participant, register
+    another), but PARTICIPANTS.id is AUTOINCREMENT and never reused, so
+    MAX(id) moves on every registration and the count moves on every net
+    deletion - together they shift the key for any participant change.
+    """
+    row = get_reader().execute('''
+        SELECT COUNT(*), MAX(created_at),
+               (SELECT COUNT(*) FROM PARTICIPANTS),
+               (SELECT MAX(id) FROM PARTICIPANTS)
+        FROM EVENTS
+    ''').fetchone()
+    state = f"{request.host}:{row[0]}:{row[1]}:{row[2]}:{row[3]}"
+    return hashlib.blake2b(state.encode(), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=8)
+def _render_dashboard_cached(state_key):
+    """Serve the rendered dashboard HTML for an unchanged database state."""
+    return _render_dashboard()
+
+
 @app.route('/dashboard')
 @login_required
 def dashboard():
     """Display admin dashboard with all events and registration links."""
-    events = get_all_events()
-    
-    # Add participant count and registration URL to each event
+    # Flash messages are rendered into the page, so responses carrying them
+    # must never be cached (or they'd replay on later loads)
+    if session.get('_flashes'):
+        return _render_dashboard()
+    return _render_dashboard_cached(_dashboard_state_key())
+
+
+def _render_dashboard():
+    """Query events and render the dashboard template (uncached)."""
+    # Single round trip: participant_count is a trigger-maintained column on
+    # EVENTS, so one plain SELECT replaces the old per-event COUNT queries
+    cursor = get_reader().execute(SQL_GET_ALL_EVENTS)
+
+    # Build each event dict with one zip over the column names - dict(Row)
+    # re-hashes every column name through the Row mapping proxy per row
+    col_names = tuple(d[0] for d in cursor.description)
+
     events_with_details = []
-    for event in events:
-        event_dict = dict(event)
-        event_dict['participant_count'] = get_participant_count(event['id'])
-        
-        # Defensive check: Safely access registration_token
-        # This prevents IndexError if the column is missing or NULL in old databases
-        token = get_event_token_safely(event)
-        
+    for row in cursor.fetchall():
+        event_dict = dict(zip(col_names, row))
+
+        # Direct access is safe: init_db() asserts the column exists after
+        # its migrations run; empty string normalizes to None
+        token = event_dict['registration_token'] or None
+
         if token:
-            event_dict['registration_url'] = url_for('public_register', token=token, _external=True)
+            event_dict['registration_url'] = registration_url_for(token)
             event_dict['has_token'] = True
         else:
             # Fallback for events without tokens (shouldn't happen after migration)
             event_dict['registration_url'] = None
             event_dict['has_token'] = False
-        
+
         events_with_details.append(event_dict)
-    
+
     return render_template('dashboard.html', events=events_with_details)
 
 
@@ -360,30 +696,21 @@ def create_event():
         registration_token = generate_registration_token()
         
         try:
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            
-            # Try inserting with registration_token first (normal case)
-            try:
-                cursor.execute('''
+            # Single-path insert: init_db()'s migrations guarantee the
+            # registration_token column before any request is served, so the
+            # old missing-column fallback was dead code on the write path
+            with write_tx() as conn:
+                conn.execute('''
                     INSERT INTO EVENTS (name, description, date, registration_token)
                     VALUES (?, ?, ?, ?)
                 ''', (name, description, date, registration_token))
-            except sqlite3.OperationalError as col_err:
-                # Fallback: If registration_token column doesn't exist,
-                # insert without it (migration will add token later)
-                if 'registration_token' in str(col_err):
-                    print(f"⚠️ Fallback: Inserting event without token (migration pending)")
-                    cursor.execute('''
-                        INSERT INTO EVENTS (name, description, date)
-                        VALUES (?, ?, ?)
-                    ''', (name, description, date))
-                else:
-                    raise  # Re-raise if it's a different error
-            
-            conn.commit()
-            conn.close()
-            
+
+            _get_event_row_cached.cache_clear()
+            _url_cache.clear()
+            # created_at has second resolution, so a create+delete+create in
+            # the same second could leave the state key unchanged - clear
+            # the rendered-page cache explicitly to be safe
+            _render_dashboard_cached.cache_clear()
             flash(f'Event "{name}" created successfully! Registration link generated.', 'success')
             return redirect(url_for('dashboard'))
         
@@ -405,17 +732,15 @@ def delete_event(event_id):
         return redirect(url_for('dashboard'))
     
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Delete participants first
-        cursor.execute('DELETE FROM PARTICIPANTS WHERE event_id = ?', (event_id,))
-        # Delete event
-        cursor.execute('DELETE FROM EVENTS WHERE id = ?', (event_id,))
-        
-        conn.commit()
-        conn.close()
-        
+        with write_tx() as conn:
+            # Delete participants first
+            conn.execute('DELETE FROM PARTICIPANTS WHERE event_id = ?', (event_id,))
+            # Delete event
+            conn.execute('DELETE FROM EVENTS WHERE id = ?', (event_id,))
+
+        _get_event_row_cached.cache_clear()
+        _url_cache.clear()
+        _render_dashboard_cached.cache_clear()
         flash(f'Event "{event["name"]}" deleted successfully.', 'success')
     except sqlite3.Error as e:
         flash(f'Database error: {str(e)}', 'error')
@@ -433,59 +758,63 @@ def public_register(token):
     Public registration page accessible via unique event token.
     No login required - open to all participants.
     """
-    # Validate token and fetch event
-    event = get_event_by_token(token)
-    
-    if not event:
-        flash('Invalid or expired registration link.', 'error')
-        return render_template('error.html', 
-                             message='Invalid Registration Link',
-                             description='The registration link you used is invalid or has expired.')
-    
     if request.method == 'POST':
         name = request.form.get('name', '').strip()
         email = request.form.get('email', '').strip().lower()
         college = request.form.get('college', '').strip()
-        
+
         # Validate inputs
         if not name or len(name) < 2:
             flash('Name must be at least 2 characters.', 'error')
             return redirect(url_for('public_register', token=token))
-        
+
         if not email or not is_valid_email(email):
             flash('Please enter a valid email address.', 'error')
             return redirect(url_for('public_register', token=token))
-        
-        if participant_exists_in_event(email, event['id']):
-            flash('This email is already registered for this event.', 'error')
-            return redirect(url_for('public_register', token=token))
-        
+
         if not college or len(college) < 2:
             flash('College/Organization must be at least 2 characters.', 'error')
             return redirect(url_for('public_register', token=token))
-        
+
         try:
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO PARTICIPANTS (event_id, name, email, college)
-                VALUES (?, ?, ?, ?)
-            ''', (event['id'], name, email, college))
-            conn.commit()
-            conn.close()
-            
+            # One connection for the whole POST: token lookup and INSERT share
+            # the writer, and the UNIQUE(event_id, email) constraint replaces
+            # the old pre-check SELECT - the duplicate path is the
+            # IntegrityError handler below
+            with write_tx() as conn:
+                event = conn.execute(SQL_GET_EVENT_BY_TOKEN, (token,)).fetchone()
+
+                if event:
+                    conn.execute(SQL_INSERT_PARTICIPANT,
+                                 (event['id'], name, email, college))
+
+            if not event:
+                flash('Invalid or expired registration link.', 'error')
+                return render_template('error.html',
+                                     message='Invalid Registration Link',
+                                     description='The registration link you used is invalid or has expired.')
+
             # Redirect to success page
-            return redirect(url_for('registration_success', 
-                                  event_name=event['name'], 
+            return redirect(url_for('registration_success',
+                                  event_name=event['name'],
                                   participant_name=name))
-        
+
         except sqlite3.IntegrityError:
             flash('This email is already registered for this event.', 'error')
             return redirect(url_for('public_register', token=token))
         except sqlite3.Error as e:
             flash(f'Registration failed. Please try again.', 'error')
             return redirect(url_for('public_register', token=token))
-    
+
+    # GET: validate token and fetch event for the registration form
+    event = get_event_by_token(token)
+
+    if not event:
+        flash('Invalid or expired registration link.', 'error')
+        return render_template('error.html',
+                             message='Invalid Registration Link',
+                             description='The registration link you used is invalid or has expired.')
+
     return render_template('public_register.html', event=event, token=token)
 
 
@@ -517,27 +846,29 @@ def view_participants(event_id):
     search_query = request.args.get('search', '').strip().lower()
     
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
+        conn = get_reader()
+
         if search_query:
-            cursor.execute('''
-                SELECT * FROM PARTICIPANTS 
-                WHERE event_id = ? AND (LOWER(name) LIKE ? OR LOWER(email) LIKE ?)
-                ORDER BY registered_at DESC
-            ''', (event_id, f'%{search_query}%', f'%{search_query}%'))
+            # FTS5 inverted-index search instead of an unindexable
+            # LOWER() LIKE table scan; the fts table is kept in sync with
+            # PARTICIPANTS by triggers (see init_db)
+            cursor = conn.execute('''
+                SELECT p.* FROM participants_fts
+                JOIN PARTICIPANTS p ON p.id = participants_fts.rowid
+                WHERE participants_fts MATCH ? AND p.event_id = ?
+                ORDER BY p.registered_at DESC
+            ''', (_fts_prefix_query(search_query), event_id))
         else:
-            cursor.execute('''
-                SELECT * FROM PARTICIPANTS 
+            cursor = conn.execute('''
+                SELECT * FROM PARTICIPANTS
                 WHERE event_id = ?
                 ORDER BY registered_at DESC
             ''', (event_id,))
-        
+
         participants = cursor.fetchall()
-        conn.close()
-        
+
         # Generate registration URL
-        registration_url = url_for('public_register', token=event['registration_token'], _external=True)
+        registration_url = registration_url_for(event['registration_token'])
         
         return render_template('participants.html',
                              event=event,
@@ -561,13 +892,11 @@ def view_participants(event_id):
 def delete_participant(event_id, participant_id):
     """Delete a participant from an event (Admin only)."""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM PARTICIPANTS WHERE id = ? AND event_id = ?', 
-                      (participant_id, event_id))
-        conn.commit()
-        conn.close()
-        
+        with write_tx() as conn:
+            conn.execute('DELETE FROM PARTICIPANTS WHERE id = ? AND event_id = ?',
+                         (participant_id, event_id))
+
+        _render_dashboard_cached.cache_clear()
         flash('Participant removed successfully.', 'success')
     except sqlite3.Error as e:
         flash(f'Database error: {str(e)}', 'error')
@@ -600,8 +929,9 @@ def internal_error(error):
 # ============================================
 
 # Initialize database on module load (required for Gunicorn)
-# This ensures tables exist when the app starts on Render
-init_db()
+# This ensures tables exist when the app starts on Render; the flock/sentinel
+# guard inside makes it effectively a no-op in all but the first worker
+init_db_once()
 
 if __name__ == '__main__':
     # Local development server only